@@ -6,88 +6,57 @@ Supports multiple recipients with personalized keyword filters.
 """
 
 import os
+import re
+import html
 import json
 import sys
 import argparse
+from functools import lru_cache
+from itertools import compress
 import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import List, Dict, Optional
+from string import Formatter
+from typing import Callable, List, Dict, Optional, Tuple, Union
+from dataclasses import dataclass
 from datetime import datetime
 
+try:
+    import ahocorasick
+except ImportError:
+    # pyahocorasick is optional; fall back to a single alternation regex
+    ahocorasick = None
 
-def parse_keywords(keyword_string: str) -> List[str]:
-    """
-    Parse keyword string, supporting semicolon and comma delimiters.
-    Examples:
-        'gesture; sign language' -> ['gesture', 'sign language']
-        'hallucination, risk' -> ['hallucination', 'risk']
-    """
-    if not keyword_string:
-        return []
-    
-    # Try semicolon first (higher priority)
-    if ';' in keyword_string:
-        keywords = [k.strip() for k in keyword_string.split(';')]
-    else:
-        # Fallback to comma
-        keywords = [k.strip() for k in keyword_string.split(',')]
-    
-    return [k for k in keywords if k]
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; the standard json module also accepts bytes
+    orjson = None
 
+_json_loads = orjson.loads if orjson is not None else json.loads
 
-def filter_papers_by_keywords(data: List[Dict], keywords: List[str]) -> List[Dict]:
-    """
-    Filter papers that match any of the specified keywords.
-    Supports both single words and multi-word phrases (e.g., "sign language").
-    Searches in: title, summary, and AI-generated fields.
-    """
-    if not keywords:
-        return []
-    
-    filtered_papers = []
-    # Normalize keywords: preserve phrases, convert to lowercase
-    keyword_lower = [k.lower().strip() for k in keywords if k.strip()]
-    
-    for paper in data:
-        # Search text includes title, summary, and AI fields
-        search_text = " ".join([
-            paper.get("title", ""),
-            paper.get("summary", ""),
-            paper.get("AI", {}).get("tldr", ""),
-            paper.get("AI", {}).get("motivation", ""),
-            paper.get("AI", {}).get("method", ""),
-        ]).lower()
-        
-        # Check if any keyword (phrase or word) matches in the search text
-        # Using 'in' operator handles both single words and phrases correctly
-        if any(keyword in search_text for keyword in keyword_lower):
-            filtered_papers.append(paper)
-    
-    return filtered_papers
 
+# Aho-Corasick automatons memoized by keyword set
+_KEYWORD_AUTOMATON_CACHE: Dict[frozenset, "ahocorasick.Automaton"] = {}
 
-def format_paper_html(paper: Dict, index: int) -> str:
-    """Format a single paper as HTML for email."""
-    title = paper.get("title", "Untitled")
-    authors = ", ".join(paper.get("authors", []))
-    arxiv_id = paper.get("id", "")
-    abs_url = paper.get("abs", f"https://arxiv.org/abs/{arxiv_id}")
-    pdf_url = paper.get("pdf", f"https://arxiv.org/pdf/{arxiv_id}")
-    
-    ai_data = paper.get("AI", {})
-    tldr = ai_data.get("tldr", "N/A")
-    motivation = ai_data.get("motivation", "N/A")
-    method = ai_data.get("method", "N/A")
-    result = ai_data.get("result", "N/A")
-    conclusion = ai_data.get("conclusion", "N/A")
-    
-    categories = ", ".join(paper.get("categories", []))
-    
-    return f"""
+# Fallback alternation regexes memoized by sorted keyword tuple
+_KEYWORD_RE_CACHE: Dict[tuple, re.Pattern] = {}
+
+# Lowercased paper text scanned for keywords. The regex fallback scans UTF-8
+# bytes (one byte per ASCII character, whatever else the text contains);
+# pyahocorasick only accepts str.
+SearchText = Union[str, bytes]
+_SEARCH_TEXT_AS_BYTES = ahocorasick is None
+
+# HTML for a single paper. The paper's position in the digest goes between
+# _PAPER_HTML_HEAD and the body, so the body can be shared by all recipients.
+_PAPER_HTML_HEAD = """
     <div style="margin-bottom: 30px; padding: 15px; border-left: 4px solid #a42c25; background-color: #f9f9f9;">
         <h3 style="margin-top: 0; color: #a42c25;">
-            {index}. {title}
+            """
+_PAPER_BODY_TEMPLATE = """{title}
         </h3>
         <p style="margin: 5px 0; color: #666;">
             <strong>Authors:</strong> {authors}
@@ -131,42 +100,45 @@ def format_paper_html(paper: Dict, index: int) -> str:
     """
 
 
-def format_email_html(papers: List[Dict], date: str, keywords: List[str], recipient_email: str = "") -> str:
-    """Format the complete email HTML."""
-    keyword_str = ", ".join(keywords)
-    paper_count = len(papers)
-    
-    papers_html = "\n".join([
-        format_paper_html(paper, i + 1) 
-        for i, paper in enumerate(papers)
+def _compile_template(template: str) -> List[Tuple[str, Optional[str]]]:
+    """
+    Split a str.format-style template into (literal, field name) pairs.
+    Parsing happens once; rendering then only joins the pieces.
+    """
+    return [(literal, field) for literal, field, _, _ in Formatter().parse(template)]
+
+
+def _render_template(parts: List[Tuple[str, Optional[str]]], values: Dict[str, str]) -> str:
+    """Render a template compiled with _compile_template()."""
+    return "".join([
+        literal + values[field] if field is not None else literal
+        for literal, field in parts
     ])
-    
-    return f"""
+
+
+# _PAPER_BODY_TEMPLATE parsed once at import time
+_PAPER_BODY_PARTS = _compile_template(_PAPER_BODY_TEMPLATE)
+
+# Static parts of the digest email, shared by every call to format_email_html()
+_EMAIL_HTML_HEAD = """
     <!DOCTYPE html>
     <html>
     <head>
         <meta charset="UTF-8">
         <style>
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-            .container {{ max-width: 800px; margin: 0 auto; padding: 20px; }}
-            .header {{ background-color: #a42c25; color: white; padding: 20px; border-radius: 5px; }}
-            .footer {{ margin-top: 30px; padding-top: 20px; border-top: 1px solid #ddd; color: #666; font-size: 12px; }}
+            body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+            .container { max-width: 800px; margin: 0 auto; padding: 20px; }
+            .header { background-color: #a42c25; color: white; padding: 20px; border-radius: 5px; }
+            .footer { margin-top: 30px; padding-top: 20px; border-top: 1px solid #ddd; color: #666; font-size: 12px; }
         </style>
     </head>
     <body>
         <div class="container">
             <div class="header">
                 <h1 style="margin: 0;">📚 Daily arXiv Digest</h1>
-                <p style="margin: 10px 0 0 0;">Your Personalized Paper Feed - {date}</p>
-            </div>
-            
-            <div style="margin: 20px 0;">
-                <p><strong>Keywords:</strong> {keyword_str}</p>
-                <p><strong>Papers Found:</strong> {paper_count}</p>
-            </div>
-            
-            {papers_html if papers else "<p>No papers found matching your keywords today.</p>"}
-            
+                <p style="margin: 10px 0 0 0;">Your Personalized Paper Feed - """
+_NO_PAPERS_HTML = "<p>No papers found matching your keywords today.</p>"
+_EMAIL_HTML_TAIL = """
             <div class="footer">
                 <p>Generated by daily-arXiv-ai-enhanced</p>
                 <p>This is an automated email digest. You can manage your email preferences in the GitHub Actions workflow.</p>
@@ -176,46 +148,285 @@ def format_email_html(papers: List[Dict], date: str, keywords: List[str], recipi
     </html>
     """
 
+# Stands in for the keyword list in the cached "no papers found" digest
+_KEYWORDS_MARKER = "\x00KEYWORDS\x00"
 
-def send_email_via_smtp(
-    to_email: str,
-    subject: str,
-    html_content: str,
+
+def parse_keywords(keyword_string: str) -> List[str]:
+    """
+    Parse keyword string, supporting semicolon and comma delimiters.
+    Examples:
+        'gesture; sign language' -> ['gesture', 'sign language']
+        'hallucination, risk' -> ['hallucination', 'risk']
+    """
+    if not keyword_string:
+        return []
+    
+    # Try semicolon first (higher priority)
+    if ';' in keyword_string:
+        keywords = [k.strip() for k in keyword_string.split(';')]
+    else:
+        # Fallback to comma
+        keywords = [k.strip() for k in keyword_string.split(',')]
+    
+    return [k for k in keywords if k]
+
+
+def _get_keyword_automaton(keywords: List[str]) -> "ahocorasick.Automaton":
+    """
+    Build (or reuse) an Aho-Corasick automaton for a set of lowercase keywords.
+    The automaton finds any of the keywords in a single linear scan of the text.
+    """
+    key = frozenset(keywords)
+    automaton = _KEYWORD_AUTOMATON_CACHE.get(key)
+    if automaton is None:
+        automaton = ahocorasick.Automaton()
+        for keyword in key:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        _KEYWORD_AUTOMATON_CACHE[key] = automaton
+    return automaton
+
+
+def _encode_search_text(text: str) -> bytes:
+    """
+    Encode text for the bytes regex fallback; keywords and search texts must
+    both go through here so they are encoded identically.
+    json.loads accepts lone surrogates such as "\\ud800", which strict UTF-8
+    refuses to encode; "surrogatepass" keeps them (unlike "ignore", which
+    would join the text around a dropped character).
+    """
+    return text.encode("utf-8", "surrogatepass")
+
+
+def _get_keyword_regex(keywords: List[str]) -> re.Pattern:
+    """
+    Compile (or reuse) a bytes alternation regex for a set of lowercase keywords.
+    Search texts are already lowercased, so no IGNORECASE flag is needed.
+    Recipients sharing a keyword set reuse the same compiled pattern.
+    """
+    key = tuple(sorted(set(keywords)))
+    pattern = _KEYWORD_RE_CACHE.get(key)
+    if pattern is None:
+        pattern = re.compile(b"|".join(re.escape(_encode_search_text(k)) for k in key))
+        _KEYWORD_RE_CACHE[key] = pattern
+    return pattern
+
+
+def _to_search_text(text: str) -> SearchText:
+    """Lowercase text (and encode it for the regex fallback) for keyword matching."""
+    text = text.lower()
+    if _SEARCH_TEXT_AS_BYTES:
+        return _encode_search_text(text)
+    return text
+
+
+def _build_search_text(paper: Dict) -> SearchText:
+    """
+    Build the lowercased search text of a paper (title, summary, and AI fields).
+    Fields are joined with NUL, which never appears in a keyword, so a phrase
+    cannot match across two fields (same as filter_papers_by_keywords).
+    """
+    get = paper.get
+    ai_get = (get("AI") or {}).get
+    return _to_search_text("\x00".join((
+        get("title", ""),
+        get("summary", ""),
+        ai_get("tldr", ""),
+        ai_get("motivation", ""),
+        ai_get("method", ""),
+    )))
+
+
+def build_search_texts(data: List[Dict]) -> List[SearchText]:
+    """
+    Build the lowercased search text of each paper.
+    Search text only depends on the paper, so it is built once and shared
+    by all recipients.
+    """
+    return [_build_search_text(paper) for paper in data]
+
+
+def _normalize_keywords(keywords: List[str]) -> List[str]:
+    """Normalize keywords: preserve phrases, convert to lowercase, drop empty ones."""
+    return [k.lower().strip() for k in keywords if k.strip()]
+
+
+def _get_keyword_matcher(keyword_lower: List[str]) -> Callable[[SearchText], object]:
+    """
+    Return a function telling whether a search text contains any of the keywords.
+    All keywords are matched in one pass instead of one scan per keyword.
+    Substring matching handles both single words and phrases correctly.
+    """
+    if ahocorasick is not None:
+        automaton = _get_keyword_automaton(keyword_lower)
+        return lambda search_text: next(automaton.iter(search_text), None) is not None
+    return _get_keyword_regex(keyword_lower).search
+
+
+def filter_papers_by_search_texts(
+    data: List[Dict],
+    search_texts: List[SearchText],
+    keywords: List[str]
+) -> List[Dict]:
+    """
+    Filter papers that match any of the specified keywords.
+    Supports both single words and multi-word phrases (e.g., "sign language").
+    `search_texts` must be the output of build_search_texts(data).
+    """
+    keyword_lower = _normalize_keywords(keywords)
+    if not keyword_lower:
+        return []
+    
+    # map() + compress() build the match mask and select papers in C,
+    # without a Python-level loop body per paper
+    matches = _get_keyword_matcher(keyword_lower)
+    return list(compress(data, map(matches, search_texts)))
+
+
+def filter_papers_by_keywords(data: List[Dict], keywords: List[str]) -> List[Dict]:
+    """
+    Filter papers that match any of the specified keywords.
+    Searches in: title, summary, and AI-generated fields.
+    When filtering the same papers for several keyword sets, build the search
+    texts once and call filter_papers_by_search_texts() instead.
+    """
+    keyword_lower = _normalize_keywords(keywords)
+    if not keyword_lower:
+        return []
+    
+    matches = _get_keyword_matcher(keyword_lower)
+    filtered_papers = []
+    for paper in data:
+        ai_get = (paper.get("AI") or {}).get
+        # Check fields one at a time and stop at the first match; most matches
+        # are in the title or summary, so later fields are never lowercased
+        for field in (
+            paper.get("title", ""),
+            paper.get("summary", ""),
+            ai_get("tldr", ""),
+            ai_get("motivation", ""),
+            ai_get("method", ""),
+        ):
+            if field and matches(_to_search_text(field)):
+                filtered_papers.append(paper)
+                break
+    
+    return filtered_papers
+
+
+def _get_escaped_paper_fields(paper: Dict) -> Dict[str, str]:
+    """
+    Return the HTML-escaped fields shown in a paper's email entry.
+    Fields are escaped on first use and stored on the paper under '_esc',
+    so a paper is escaped once no matter how many digests include it.
+    """
+    escaped = paper.get("_esc")
+    if escaped is None:
+        arxiv_id = paper.get("id", "")
+        ai_data = paper.get("AI") or {}
+        fields = {
+            "title": paper.get("title", "Untitled"),
+            "authors": ", ".join(paper.get("authors", [])),
+            "categories": ", ".join(paper.get("categories", [])),
+            "arxiv_id": arxiv_id,
+            "abs_url": paper.get("abs", f"https://arxiv.org/abs/{arxiv_id}"),
+            "pdf_url": paper.get("pdf", f"https://arxiv.org/pdf/{arxiv_id}"),
+            "tldr": ai_data.get("tldr", "N/A"),
+            "motivation": ai_data.get("motivation", "N/A"),
+            "method": ai_data.get("method", "N/A"),
+            "result": ai_data.get("result", "N/A"),
+            "conclusion": ai_data.get("conclusion", "N/A"),
+        }
+        escaped = {key: html.escape(str(value)) for key, value in fields.items()}
+        paper["_esc"] = escaped
+    return escaped
+
+
+def format_paper_body_html(paper: Dict) -> str:
+    """
+    Format a single paper as HTML for email, without its index.
+    The result only depends on the paper, so it can be cached across recipients.
+    """
+    return _render_template(_PAPER_BODY_PARTS, _get_escaped_paper_fields(paper))
+
+
+def format_paper_html(paper: Dict, index: int) -> str:
+    """Format a single paper as HTML for email."""
+    return f"{_PAPER_HTML_HEAD}{index}. {format_paper_body_html(paper)}"
+
+
+@lru_cache(maxsize=64)
+def _email_header_html(date: str, keywords: Tuple[str, ...]) -> str:
+    """
+    Format the start of the email up to the keyword line.
+    Cached, since recipients often share the same date and keywords.
+    """
+    keyword_str = html.escape(", ".join(keywords))
+    return f"""{_EMAIL_HTML_HEAD}{date}</p>
+            </div>
+            
+            <div style="margin: 20px 0;">
+                <p><strong>Keywords:</strong> {keyword_str}</p>"""
+
+
+def format_email_html(
+    papers: List[Dict],
+    date: str,
+    keywords: List[str],
+    recipient_email: str = "",
+    paper_html_cache: Optional[Dict[int, str]] = None
+) -> str:
+    """
+    Format the complete email HTML.
+    `paper_html_cache` maps id(paper) to its formatted body; pass the same dict
+    for every recipient so each paper is only formatted once.
+    """
+    paper_count = len(papers)
+    
+    if paper_html_cache is None:
+        paper_html_cache = {}
+    
+    papers_html_parts = []
+    for i, paper in enumerate(papers, 1):
+        body = paper_html_cache.get(id(paper))
+        if body is None:
+            body = format_paper_body_html(paper)
+            paper_html_cache[id(paper)] = body
+        papers_html_parts.append(f"{_PAPER_HTML_HEAD}{i}. {body}")
+    papers_html = "\n".join(papers_html_parts)
+    
+    return f"""{_email_header_html(date, tuple(keywords))}
+                <p><strong>Papers Found:</strong> {paper_count}</p>
+            </div>
+            
+            {papers_html or _NO_PAPERS_HTML}
+            {_EMAIL_HTML_TAIL}"""
+
+
+def _connect_smtp(
     smtp_server: str,
     smtp_port: int,
     smtp_user: str,
-    smtp_password: str,
-    from_email: str = None
-):
-    """Send email via SMTP (Gmail, Outlook, custom SMTP)."""
-    if from_email is None:
-        from_email = smtp_user
-    
-    msg = MIMEMultipart('alternative')
-    msg['Subject'] = subject
-    msg['From'] = from_email
-    msg['To'] = to_email
-    
-    # Create plain text version (fallback)
-    text_content = "Please view this email in an HTML-capable email client."
-    part1 = MIMEText(text_content, 'plain')
-    part2 = MIMEText(html_content, 'html')
+    smtp_password: str
+) -> smtplib.SMTP:
+    """
+    Open an SMTP connection and log in.
+    Returns a live connection that can send any number of messages.
+    """
+    print(f"Connecting to SMTP server: {smtp_server}:{smtp_port}...", file=sys.stderr)
     
-    msg.attach(part1)
-    msg.attach(part2)
+    # Port 465 uses SSL, port 587 uses STARTTLS
+    if smtp_port == 465:
+        # Use SSL connection for port 465
+        server = smtplib.SMTP_SSL(smtp_server, smtp_port, timeout=30)
+        print("Using SSL connection (port 465)", file=sys.stderr)
+    else:
+        # Use STARTTLS for port 587 and others
+        server = smtplib.SMTP(smtp_server, smtp_port, timeout=30)
     
-    server = None
     try:
-        print(f"Connecting to SMTP server: {smtp_server}:{smtp_port}...", file=sys.stderr)
-        
-        # Port 465 uses SSL, port 587 uses STARTTLS
-        if smtp_port == 465:
-            # Use SSL connection for port 465
-            server = smtplib.SMTP_SSL(smtp_server, smtp_port, timeout=30)
-            print("Using SSL connection (port 465)", file=sys.stderr)
-        else:
-            # Use STARTTLS for port 587 and others
-            server = smtplib.SMTP(smtp_server, smtp_port, timeout=30)
+        if smtp_port != 465:
             print("Connected, starting TLS...", file=sys.stderr)
             server.starttls()
             print("TLS started successfully", file=sys.stderr)
@@ -226,42 +437,132 @@ def send_email_via_smtp(
         print(f"Logging in as {smtp_user}...", file=sys.stderr)
         server.login(smtp_user, smtp_password)
         print("Login successful", file=sys.stderr)
-        
-        print(f"Sending email to {to_email}...", file=sys.stderr)
-        server.send_message(msg)
-        print(f"✅ Email sent successfully to {to_email}", file=sys.stderr)
-        return True
-        
-    except smtplib.SMTPAuthenticationError as e:
+    except Exception:
+        _close_smtp(server)
+        raise
+    
+    return server
+
+
+def _close_smtp(server: Optional[smtplib.SMTP]):
+    """Close an SMTP connection, ignoring errors from an already dropped connection."""
+    if server:
+        try:
+            server.quit()
+        except Exception:
+            pass
+
+
+def _report_smtp_error(e: Exception, smtp_server: str, smtp_port: int):
+    """Print a diagnostic message for an SMTP failure."""
+    if isinstance(e, smtplib.SMTPAuthenticationError):
         print(f"SMTP Authentication Error: {e}", file=sys.stderr)
         print("Please verify your SMTP_USER and SMTP_PASSWORD are correct.", file=sys.stderr)
         print("For Gmail, make sure you're using an App Password (not your regular password).", file=sys.stderr)
-        return False
-    except smtplib.SMTPConnectError as e:
+    elif isinstance(e, smtplib.SMTPConnectError):
         print(f"SMTP Connection Error: Could not connect to {smtp_server}:{smtp_port}", file=sys.stderr)
         print(f"Error details: {e}", file=sys.stderr)
         print("Please verify SMTP_SERVER and SMTP_PORT are correct.", file=sys.stderr)
-        return False
-    except smtplib.SMTPServerDisconnected as e:
+    elif isinstance(e, smtplib.SMTPServerDisconnected):
         print(f"SMTP Server Disconnected: {e}", file=sys.stderr)
         print("The server closed the connection unexpectedly.", file=sys.stderr)
         print("This might be due to:", file=sys.stderr)
         print("  - Incorrect SMTP port (try 587 for TLS or 465 for SSL)", file=sys.stderr)
         print("  - Authentication failure", file=sys.stderr)
         print("  - Server blocking the connection", file=sys.stderr)
-        return False
-    except Exception as e:
+    else:
         print(f"Failed to send email: {type(e).__name__}: {e}", file=sys.stderr)
         import traceback
-        traceback.print_exc(file=sys.stderr)
+        traceback.print_exception(e, file=sys.stderr)
+
+
+def send_via_open_connection(
+    server: smtplib.SMTP,
+    to_email: str,
+    subject: str,
+    html_content: str,
+    from_email: str
+):
+    """Send one email over an already logged-in SMTP connection."""
+    msg = MIMEMultipart('alternative')
+    msg['Subject'] = subject
+    msg['From'] = from_email
+    msg['To'] = to_email
+    
+    # Create plain text version (fallback)
+    text_content = "Please view this email in an HTML-capable email client."
+    part1 = MIMEText(text_content, 'plain')
+    part2 = MIMEText(html_content, 'html')
+    
+    msg.attach(part1)
+    msg.attach(part2)
+    
+    print(f"Sending email to {to_email}...", file=sys.stderr)
+    server.send_message(msg)
+    print(f"✅ Email sent successfully to {to_email}", file=sys.stderr)
+
+
+def _send_reusing_connection(
+    server: Optional[smtplib.SMTP],
+    smtp_config: tuple,
+    to_email: str,
+    subject: str,
+    html_content: str,
+    from_email: str
+):
+    """
+    Send one email, reusing `server` when it is still open.
+    If the server dropped the connection, reconnect once and retry.
+    Returns (success, server); the returned server is None if it is unusable.
+    """
+    for attempt in range(2):
+        try:
+            if server is None:
+                server = _connect_smtp(*smtp_config)
+            send_via_open_connection(server, to_email, subject, html_content, from_email)
+            return True, server
+        except smtplib.SMTPServerDisconnected as e:
+            _close_smtp(server)
+            server = None
+            if attempt == 0:
+                print("SMTP connection dropped, reconnecting...", file=sys.stderr)
+                continue
+            _report_smtp_error(e, smtp_config[0], smtp_config[1])
+        except Exception as e:
+            # Start from a fresh connection for the next recipient
+            _close_smtp(server)
+            server = None
+            _report_smtp_error(e, smtp_config[0], smtp_config[1])
+            break
+    
+    return False, server
+
+
+def send_email_via_smtp(
+    to_email: str,
+    subject: str,
+    html_content: str,
+    smtp_server: str,
+    smtp_port: int,
+    smtp_user: str,
+    smtp_password: str,
+    from_email: str = None
+):
+    """Send a single email via SMTP (Gmail, Outlook, custom SMTP)."""
+    if from_email is None:
+        from_email = smtp_user
+    
+    server = None
+    try:
+        server = _connect_smtp(smtp_server, smtp_port, smtp_user, smtp_password)
+        send_via_open_connection(server, to_email, subject, html_content, from_email)
+        return True
+    except Exception as e:
+        _report_smtp_error(e, smtp_server, smtp_port)
         return False
     finally:
         # Ensure connection is closed
-        if server:
-            try:
-                server.quit()
-            except:
-                pass
+        _close_smtp(server)
 
 
 def parse_args():
@@ -298,13 +599,50 @@ def parse_args():
         type=str,
         help="Date string for email (default: today)"
     )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=4,
+        help="Number of parallel SMTP connections (default: 4). "
+             "Keep this small; most SMTP providers throttle concurrent logins."
+    )
     return parser.parse_args()
 
 
-def load_recipients_config(args) -> List[Dict]:
+@dataclass(slots=True)
+class Recipient:
+    """A digest recipient and the keywords their papers are filtered by."""
+    email: str
+    keywords: List[str]
+
+
+def _normalize_recipients(config_data: List[Dict]) -> List[Recipient]:
+    """
+    Validate and normalize recipient config items.
+    Keywords may be a delimited string (see parse_keywords) or a list.
+    """
+    recipients = []
+    for item in config_data:
+        if 'email' not in item:
+            print(f"Warning: Skipping config item without email: {item}", file=sys.stderr)
+            continue
+        
+        # Parse keywords (support string or list)
+        keywords = item.get('keywords')
+        if isinstance(keywords, str):
+            keywords = parse_keywords(keywords)
+        elif not isinstance(keywords, list):
+            keywords = []
+        
+        recipients.append(Recipient(item['email'], keywords))
+    
+    return recipients
+
+
+def load_recipients_config(args) -> List[Recipient]:
     """
     Load recipient configurations from various sources.
-    Returns list of dicts with 'email' and 'keywords' keys.
+    Returns list of Recipient with email and keywords.
     """
     # Priority 1: --recipients-config argument
     if args.recipients_config:
@@ -313,33 +651,14 @@ def load_recipients_config(args) -> List[Dict]:
         # Check if it's a file path
         if os.path.isfile(config_str):
             print(f"Loading recipients config from file: {config_str}", file=sys.stderr)
-            with open(config_str, 'r') as f:
-                config_data = json.load(f)
+            with open(config_str, 'rb') as f:
+                config_data = _json_loads(f.read())
         else:
             # Try to parse as JSON string
             print("Parsing recipients config from JSON string", file=sys.stderr)
-            config_data = json.loads(config_str)
-        
-        # Validate and normalize config
-        recipients = []
-        for item in config_data:
-            if 'email' not in item:
-                print(f"Warning: Skipping config item without email: {item}", file=sys.stderr)
-                continue
-            
-            # Parse keywords (support string or list)
-            if isinstance(item.get('keywords'), str):
-                keywords = parse_keywords(item['keywords'])
-            elif isinstance(item.get('keywords'), list):
-                keywords = item['keywords']
-            else:
-                keywords = []
-            
-            recipients.append({
-                'email': item['email'],
-                'keywords': keywords
-            })
+            config_data = _json_loads(config_str)
         
+        recipients = _normalize_recipients(config_data)
         print(f"Loaded {len(recipients)} recipient configurations", file=sys.stderr)
         return recipients
     
@@ -348,24 +667,8 @@ def load_recipients_config(args) -> List[Dict]:
     if env_config:
         print("Loading recipients config from EMAIL_RECIPIENTS_CONFIG env var", file=sys.stderr)
         try:
-            config_data = json.loads(env_config)
-            recipients = []
-            for item in config_data:
-                if 'email' not in item:
-                    continue
-                
-                if isinstance(item.get('keywords'), str):
-                    keywords = parse_keywords(item['keywords'])
-                elif isinstance(item.get('keywords'), list):
-                    keywords = item['keywords']
-                else:
-                    keywords = []
-                
-                recipients.append({
-                    'email': item['email'],
-                    'keywords': keywords
-                })
-            
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError
+            recipients = _normalize_recipients(_json_loads(env_config))
             print(f"Loaded {len(recipients)} recipient configurations from env", file=sys.stderr)
             return recipients
         except json.JSONDecodeError as e:
@@ -376,10 +679,7 @@ def load_recipients_config(args) -> List[Dict]:
     if email_recipient:
         print("Using legacy single recipient mode", file=sys.stderr)
         keywords = [k.lower() for k in args.keywords]
-        return [{
-            'email': email_recipient,
-            'keywords': keywords
-        }]
+        return [Recipient(email_recipient, keywords)]
     
     return []
 
@@ -413,10 +713,15 @@ def main():
     
     # Load paper data once
     print(f"Loading papers from {args.data}...", file=sys.stderr)
+    # Search texts only depend on the paper, so build them once for all
+    # recipients, in the same pass that parses the raw JSONL bytes
     papers = []
-    with open(args.data, "r") as f:
+    search_texts = []
+    with open(args.data, "rb") as f:
         for line in f:
-            papers.append(json.loads(line))
+            paper = _json_loads(line)
+            papers.append(paper)
+            search_texts.append(_build_search_text(paper))
     
     print(f"Loaded {len(papers)} papers total", file=sys.stderr)
     print(f"Processing {len(recipients)} recipient(s)...", file=sys.stderr)
@@ -425,40 +730,80 @@ def main():
     # Send personalized emails to each recipient
     success_count = 0
     fail_count = 0
+    # Recipients with the same keyword set share one filtering result
+    filter_cache: Dict[frozenset, List[Dict]] = {}
+    # Paper HTML does not depend on the recipient, so format each paper once
+    paper_html_cache: Dict[int, str] = {}
+    # Digest for recipients without matches, built once; only the keywords differ
+    empty_email_html = format_email_html([], date_str, [_KEYWORDS_MARKER])
+    
+    # Each worker thread opens one SMTP connection (TLS handshake + login)
+    # lazily and reuses it for every recipient it handles
+    smtp_config = (smtp_server, smtp_port, smtp_user, smtp_password)
+    connections: Dict[str, Optional[smtplib.SMTP]] = {}
     
-    for idx, recipient in enumerate(recipients, 1):
-        recipient_email = recipient['email']
-        keywords = recipient['keywords']
+    def send_to_recipient(idx: int, recipient: Recipient) -> bool:
+        worker = threading.current_thread().name
+        recipient_email = recipient.email
+        keywords = recipient.keywords
         
-        print(f"\n[{idx}/{len(recipients)}] Processing: {recipient_email}", file=sys.stderr)
-        print(f"  Keywords: {', '.join(keywords)}", file=sys.stderr)
+        print(f"\n[{worker}] [{idx}/{len(recipients)}] Processing: {recipient_email}", file=sys.stderr)
+        print(f"[{worker}]   Keywords: {', '.join(keywords)}", file=sys.stderr)
         
         # Filter papers by this recipient's keywords
-        filtered_papers = filter_papers_by_keywords(papers, keywords)
-        print(f"  Found {len(filtered_papers)} matching papers", file=sys.stderr)
+        cache_key = frozenset(k.lower().strip() for k in keywords)
+        filtered_papers = filter_cache.get(cache_key)
+        if filtered_papers is None:
+            filtered_papers = filter_papers_by_search_texts(papers, search_texts, keywords)
+            filter_cache[cache_key] = filtered_papers
+        print(f"[{worker}]   Found {len(filtered_papers)} matching papers", file=sys.stderr)
         
         # Format email with personalized content
         subject = f"Daily arXiv Digest: {len(filtered_papers)} Papers ({date_str})"
-        html_content = format_email_html(filtered_papers, date_str, keywords, recipient_email)
+        if filtered_papers:
+            html_content = format_email_html(
+                filtered_papers, date_str, keywords, recipient_email, paper_html_cache
+            )
+        else:
+            html_content = empty_email_html.replace(_KEYWORDS_MARKER, html.escape(", ".join(keywords)))
         
-        # Send email
-        success = send_email_via_smtp(
+        # Send email over this worker's connection
+        success, connections[worker] = _send_reusing_connection(
+            connections.get(worker),
+            smtp_config,
             to_email=recipient_email,
             subject=subject,
             html_content=html_content,
-            smtp_server=smtp_server,
-            smtp_port=smtp_port,
-            smtp_user=smtp_user,
-            smtp_password=smtp_password,
             from_email=email_from
         )
         
         if success:
-            success_count += 1
-            print(f"  ✅ Success: Sent digest with {len(filtered_papers)} papers", file=sys.stderr)
+            print(f"[{worker}]   ✅ Success: Sent digest with {len(filtered_papers)} papers", file=sys.stderr)
         else:
-            fail_count += 1
-            print(f"  ❌ Failed: Could not send email", file=sys.stderr)
+            print(f"[{worker}]   ❌ Failed: Could not send email", file=sys.stderr)
+        return success
+    
+    max_workers = max(1, min(args.max_workers, len(recipients)))
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="smtp") as executor:
+            futures = [
+                executor.submit(send_to_recipient, idx, recipient)
+                for idx, recipient in enumerate(recipients, 1)
+            ]
+            for future in as_completed(futures):
+                try:
+                    success = future.result()
+                except Exception as e:
+                    print(f"Unexpected error while processing recipient: {type(e).__name__}: {e}", file=sys.stderr)
+                    success = False
+                
+                if success:
+                    success_count += 1
+                else:
+                    fail_count += 1
+    finally:
+        for server in connections.values():
+            _close_smtp(server)
     
     # Summary
     print("=" * 60, file=sys.stderr)